@@ -3,9 +3,18 @@ from __future__ import division
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from jellyfish import soundex, nysiis, metaphone
+from functools import lru_cache
+
+import jellyfish
+
 from .metaphone import doublemetaphone as dmetaphone
 
+# Names repeat heavily across a population, so remember recent compressions.
+# dmetaphone is already cached in the metaphone module.
+soundex = lru_cache(maxsize=4096)(jellyfish.soundex)
+nysiis = lru_cache(maxsize=4096)(jellyfish.nysiis)
+metaphone = lru_cache(maxsize=4096)(jellyfish.metaphone)
+
 
 def first_letter(name):
     """A simple name compression that returns the first letter of the name.
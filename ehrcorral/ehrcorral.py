@@ -8,17 +8,13 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import sys
-from collections import namedtuple, defaultdict
+from collections import namedtuple, defaultdict, Counter
 
 import numpy as np
-from pylev import damerau_levenshtein
 
-try:
-    from collections import Counter
-except ImportError:
-    from backport_collections import Counter
 from .compressions import first_letter, dmetaphone
-from .measures import record_similarity
+from .measures import record_similarity, damerau_levenshtein, \
+    get_clean_address
 
 # Make unicode compatible with Python 2 and 3
 try:
@@ -80,13 +76,15 @@ def compress(names, method):
     if not isinstance(names, list):
         ValueError("Expected a list of names, got a {0}.".format(type(names)))
     compressions = []
-    raw_compressions = map(method, names)
+    append = compressions.append
     # Double metaphone returns a list of tuples, so need to unpack it
-    for item in raw_compressions:
+    for item in map(method, names):
         if isinstance(item, (list, tuple)):
-            compressions.extend([unicode(sub) for sub in item if sub != ''])
+            for sub in item:
+                if sub != '':
+                    append(unicode(sub))
         elif item != '':
-            compressions.append(unicode(item))
+            append(unicode(item))
     return compressions if compressions else ['']
 
 
@@ -189,11 +187,24 @@ class Record(object):
     """A Record contains identifying information about a patient, as well as
     generated phonemic and meta information.
     """
+    __slots__ = ('_profile', '_meta', '_blocks', '_clean_address')
+
     def __init__(self):
         self.profile = None
         self._meta = None
         self._blocks = None
 
+    @property
+    def profile(self):
+        """The :py:class:`.Profile` of the Record."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile):
+        self._profile = profile
+        # The cleaned address belongs to the old profile
+        self._clean_address = None
+
     def __unicode__(self):
         if self.profile is None:
             return ''
@@ -263,7 +274,8 @@ class Record(object):
         for base in bases:
             for forename in forenames:
                 block = base + forename[0]
-                blocks.append(block.upper())
+                # Records sharing a block then share one key string
+                blocks.append(sys.intern(block.upper()))
         self._blocks = tuple(set(blocks))
 
 
@@ -282,6 +294,9 @@ class Herd(object):
         self._block_dict = defaultdict(list)
         self._surname_freq_dict = Counter()
         self._forename_freq_dict = Counter()
+        # Running totals of the counters, used to turn counts into frequencies
+        self._surname_freq_total = 0
+        self._forename_freq_total = 0
         self.similarity_matrix = None
 
     def __unicode__(self):
@@ -368,9 +383,9 @@ class Herd(object):
                 sys.exc_info()
             record.save_name_freq_refs(i, forename_freq_method,
                                        surname_freq_method)
-            self.append_names_freq_counters(record)
             # Keep track of the Record's blocking codes in the Herd
             self.append_block_dict(record)
+        self.count_names_freqs()
         for record in self._population:
             self.append_similarity_matrix_row(record)
 
@@ -409,18 +424,53 @@ class Herd(object):
         surnames = [surname for surname in surnames if surname != '']
         self._forename_freq_dict.update(forenames)
         self._surname_freq_dict.update(surnames)
+        self._forename_freq_total += len(forenames)
+        self._surname_freq_total += len(surnames)
+
+    def count_names_freqs(self):
+        """Counts the forename and surname compressions of every Record in
+        the Herd into the forename and surname counters.
+
+        Each counter is filled by a single update over the whole population,
+        so the counting loop runs inside Counter rather than once per Record.
+        """
+        metas = [record._meta for record in self._population]
+        forenames = [ref for meta in metas
+                     for ref in (meta.forename_freq_ref,
+                                 meta.mid_forename_freq_ref)
+                     if ref != '']
+        surnames = [ref for meta in metas
+                    for ref in (meta.birth_surname_freq_ref,
+                                meta.current_surname_freq_ref)
+                    if ref != '']
+        self._forename_freq_dict.update(forenames)
+        self._surname_freq_dict.update(surnames)
+        self._forename_freq_total += len(forenames)
+        self._surname_freq_total += len(surnames)
 
     def append_similarity_matrix_row(self, comparison_record):
-        row = comparison_record._meta.accession
+        """Fills in the given Record's row of the similarity matrix.
+
+        Only Records that share at least one block with the given Record are
+        compared, and each of them is compared once no matter how many blocks
+        they share.
+
+        Args:
+            comparison_record (:py:class:`.Record`): An object of class
+                :py:class:`.Record`
+        """
+        candidates = {}
         for block in comparison_record._blocks:
             for record in self._block_dict[block]:
-                col = record._meta.accession
-                self.similarity_matrix[row][col] = \
-                    record_similarity(self,
-                                      comparison_record,
-                                      record,
-                                      damerau_levenshtein,
-                                      damerau_levenshtein)
+                candidates[record._meta.accession] = record
+        similarity_row = self.similarity_matrix[
+            comparison_record._meta.accession]
+        for col, record in candidates.items():
+            similarity_row[col] = record_similarity(self,
+                                                    comparison_record,
+                                                    record,
+                                                    damerau_levenshtein,
+                                                    damerau_levenshtein)
 
 
 def gen_record(data):
@@ -442,5 +492,7 @@ def gen_record(data):
         raise ValueError("A forename and current surname must be supplied.")
     record = Record()
     record.profile = profile
+    # Clean the address once here rather than for every pair it is scored in
+    get_clean_address(record)
     return record
 
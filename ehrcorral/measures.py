@@ -9,8 +9,64 @@ from __future__ import unicode_literals
 import json
 import pkgutil
 import string
+from functools import lru_cache
 
-from pylev import damerau_levenshtein
+
+def damerau_levenshtein(first, second):
+    """Compute the Damerau-Levenshtein distance between two strings.
+
+    Uses Hyyrö's bit-parallel algorithm, in which each column of the dynamic
+    programming matrix is packed into the bits of a single integer, so the
+    distance is found with a handful of bitwise operations per character
+    instead of a full row of comparisons. Adjacent transpositions are counted
+    as in the optimal string alignment variant of the distance.
+
+    Args:
+        first (unicode): The first string to compare.
+        second (unicode): The second string to compare.
+
+    Returns:
+        The number of insertions, deletions, substitutions, and adjacent
+        transpositions needed to turn one string into the other.
+    """
+    if first == second:
+        return 0
+    # The shorter string is packed into the bit vectors
+    if len(first) > len(second):
+        first, second = second, first
+    length = len(first)
+    if length == 0:
+        return len(second)
+    match_masks = {}
+    bit = 1
+    for char in first:
+        match_masks[char] = match_masks.get(char, 0) | bit
+        bit <<= 1
+    mask = (1 << length) - 1
+    high_bit = 1 << (length - 1)
+    # Vertical positive/negative deltas of the current column, and diagonal
+    # zero-delta bits of the previous one
+    vp = mask
+    vn = 0
+    d0 = 0
+    prev_match = 0
+    distance = length
+    for char in second:
+        match = match_masks.get(char, 0)
+        transposition = (((~d0) & match) << 1) & prev_match
+        d0 = ((((match & vp) + vp) & mask) ^ vp) | match | vn | transposition
+        hp = vn | (~(d0 | vp) & mask)
+        hn = d0 & vp
+        if hp & high_bit:
+            distance += 1
+        elif hn & high_bit:
+            distance -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(d0 | hp) & mask)
+        vn = hp & d0
+        prev_match = match
+    return distance
 
 
 def record_similarity(herd,
@@ -65,16 +121,15 @@ def record_similarity(herd,
     dob_similarity = get_dob_similarity([first_record, second_record])
     id_similarity = get_id_similarity([first_record, second_record],
                                       damerau_levenshtein)
-    # did not include GP (doctor), place of birth, hospital and hospital number
-    name_sum = forename_similarity + mid_forename_similarity + \
-        birth_surname_similarity + current_surname_similarity
-    # since we are not using a few of the ox-link weights, the non-name
-    # numbers will be different
-    non_name_sum = address_similarity + post_code_similarity + sex_similarity +\
-        dob_similarity + id_similarity
-    # sum of max weights for all fields
-    max_similarity = fore_max + mid_fore_max + bir_sur_max + cur_sur_max + 33.0
-    return (name_sum + non_name_sum) / max_similarity
+    # did not include GP (doctor), place of birth, hospital and hospital
+    # number. Since we are not using a few of the ox-link weights, the
+    # non-name numbers will be different. All weights are summed in a single
+    # pass and divided by the sum of max weights for all fields.
+    return (forename_similarity + mid_forename_similarity +
+            birth_surname_similarity + current_surname_similarity +
+            address_similarity + post_code_similarity + sex_similarity +
+            dob_similarity + id_similarity) / \
+        (fore_max + mid_fore_max + bir_sur_max + cur_sur_max + 33.0)
 
 
 def get_forename_similarity(herd, records, method, name_type):
@@ -118,7 +173,7 @@ def get_forename_similarity(herd, records, method, name_type):
     second_forename = second_forename[min_index]
     second_freq = second_freq[min_index]
     max_length = max(len(first_forename), len(second_forename))
-    prop_diff = float(difference) / max_length
+    prop_diff = difference / max_length
     prop_freq = max(first_freq, second_freq, 1.0 / 1000)
     # scale instead of using cutoff
     cutoff = 5.0 / 26  # arbitrary, could be improved
@@ -148,11 +203,11 @@ def extract_forename_similarity_info(herd, record, name_type):
     if name_type == "fore":
         forename = profile.forename.lower()
         weight = herd._forename_freq_dict[record._meta.forename_freq_ref] / \
-            float(sum(herd._forename_freq_dict.values()))
+            herd._forename_freq_total
     elif name_type == "mid_fore":
         forename = profile.mid_forename.lower()
         weight = herd._forename_freq_dict[record._meta.mid_forename_freq_ref]\
-            / float(sum(herd._forename_freq_dict.values()))
+            / herd._forename_freq_total
     return forename, weight
 
 
@@ -197,7 +252,7 @@ def get_surname_similarity(herd, records, method, name_type):
     second_surname = second_surname[min_index]
     second_freq = second_freq[min_index]
     max_length = max(len(first_surname), len(second_surname))
-    prop_diff = float(difference) / max_length
+    prop_diff = difference / max_length
     prop_freq = max(first_freq, second_freq, 1.0 / 1000)
     cutoff = 1.0 / 500  # arbitrary, could be improved
     S = 6 if prop_freq > cutoff else 17
@@ -226,11 +281,11 @@ def extract_surname_similarity_info(herd, record, name_type):
     if name_type == "birth":
         surname = profile.birth_surname.lower()
         weight = herd._surname_freq_dict[record._meta.birth_surname_freq_ref]\
-            / float(sum(herd._surname_freq_dict.values()))
+            / herd._surname_freq_total
     elif name_type == "current":
         surname = profile.current_surname.lower()
         weight = herd._surname_freq_dict[record._meta.current_surname_freq_ref]\
-            / float(sum(herd._surname_freq_dict.values()))
+            / herd._surname_freq_total
     return surname, weight
 
 
@@ -246,16 +301,8 @@ def get_address_similarity(records, method=damerau_levenshtein):
         The address weight for the similarity of the addresses.
     """
     # ox-link only takes first 8 characters
-    first_profile = records[0].profile
-    second_profile = records[1].profile
-    first_address = first_profile.address1.lower() +\
-        ' ' +\
-        first_profile.address2.lower()
-    second_address = second_profile.address1.lower() +\
-        ' ' +\
-        second_profile.address2.lower()
-    first_address = clean_address(first_address)
-    second_address = clean_address(second_address)
+    first_address = get_clean_address(records[0])
+    second_address = get_clean_address(records[1])
     difference = method(first_address[:12], second_address[:12])
     if difference == 0:
         return 7
@@ -267,6 +314,25 @@ def get_address_similarity(records, method=damerau_levenshtein):
     # return 7 if diff1 == 0 else 0
 
 
+def get_clean_address(record):
+    """Get the cleaned address of a record, cleaning and storing it on the
+    record the first time it is needed.
+
+    Args:
+        record (Record): An object of :py:class:`.Record`.
+
+    Returns:
+        The cleaned unicode string of both address lines.
+    """
+    address = getattr(record, '_clean_address', None)
+    if address is None:
+        profile = record.profile
+        address = clean_address(profile.address1.lower() + ' ' +
+                                profile.address2.lower())
+        record._clean_address = address
+    return address
+
+
 def clean_address(address):
     """Clean unicode string that contains an address of all punctuation and
     standardize all street suffixes and unit designators.
@@ -409,6 +475,7 @@ def get_id_similarity(records, method=damerau_levenshtein):
     # return 7 if difference == 0 else 0
 
 
+@lru_cache(maxsize=None)
 def get_json(file_name):
     data = pkgutil.get_data('ehrcorral', file_name)
     return json.loads(data.decode())
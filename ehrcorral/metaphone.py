@@ -86,205 +86,294 @@ from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import threading
+from functools import lru_cache
+from string import ascii_uppercase
+
 from .word import Word
 
 
-VOWELS = ['A', 'E', 'I', 'O', 'U', 'Y']
-SILENT_STARTERS = ["GN", "KN", "PN", "WR", "PS"]
+VOWELS = frozenset(['A', 'E', 'I', 'O', 'U', 'Y'])
+# vowels that soften a preceding 'DG', 'G' or 'SC'
+FRONT_VOWELS = frozenset(['E', 'I', 'Y'])
+SILENT_STARTERS = frozenset(['GN', 'KN', 'PN', 'WR', 'PS'])
+# Single letter classes tested by the process_* methods
+C_TS = frozenset('TS')
+C_BACK_VOWELS = frozenset('AOUE')
+# letters after 'ch' that give a 'kh' sound
+C_CH_HARD_NEXT = frozenset('LRNMBHFVW')
+C_IEH = frozenset('IEH')
+C_CKQ = frozenset('CKQ')
+# Parker's rule, e.g. 'hugh'
+G_BHD = frozenset('BHD')
+G_BH = frozenset('BH')
+# e.g. 'laugh', 'cough', 'rough', 'tough'
+G_CGLRT = frozenset('CGLRT')
+G_EI = frozenset('EI')
+AO = frozenset('AO')
+J_SILENT_NEXT = frozenset('LTKSNMBZ')
+J_SILENT_PREV = frozenset('SKL')
+# e.g. 'campbell', 'raspberry'
+P_PB = frozenset('PB')
+# e.g. 'smith', 'snider'
+S_MNLW = frozenset('MNLW')
+S_SZ = frozenset('SZ')
+T_TD = frozenset('TD')
+X_CX = frozenset('CX')
+# Multi-letter contexts tested by the process_* methods
+# germanic e.g. 'bacher', 'macher'
+C_ACHER = frozenset(['BACHER', 'MACHER'])
+# greek e.g. 'character', 'charisma'
+C_CH_GREEK_LONG = frozenset(['HARAC', 'HARIS'])
+# greek e.g. 'chorus', 'chymist', 'chemist'
+C_CH_GREEK_SHORT = frozenset(['HOR', 'HYM', 'HIA', 'HEM'])
+# 'ch' with a 'kh' sound
+C_CH_K_SOUND = frozenset(['ORCHES', 'ARCHIT', 'ORCHID'])
+# e.g. 'succeed', 'success'
+C_UCCE = frozenset(['UCCEE', 'UCCES'])
+C_HARD_PAIRS = frozenset(['CK', 'CG', 'CQ'])
+C_SOFT_PAIRS = frozenset(['CI', 'CE', 'CY'])
+C_ITALIAN = frozenset(['CIO', 'CIE', 'CIA'])
+# e.g. 'mac caffrey', 'mac gregor'
+C_MAC_SPACED = frozenset([' C', ' Q', ' G'])
+C_CE_CI = frozenset(['CE', 'CI'])
+D_T_PAIRS = frozenset(['DT', 'DD'])
+# -ges-, -gep-, -gel-, -gie- at beginning
+G_SOFT_START = frozenset(['ES', 'EP', 'EB', 'EL', 'EY', 'IB', 'IL', 'IN', 'IE',
+                          'EI', 'ER'])
+G_ANGER = frozenset(['DANGER', 'RANGER', 'MANGER'])
+G_GY = frozenset(['RGY', 'OGY'])
+# e.g. 'biaggi'
+G_ITALIAN = frozenset(['AGGI', 'OGGI'])
+# e.g. 'cabrillo', 'gallegos'
+L_SPANISH = frozenset(['ILLO', 'ILLA', 'ALLE'])
+L_SPANISH_ENDINGS = frozenset(['AS', 'OS'])
+# e.g. 'hochmeier'
+R_ME_MA = frozenset(['ME', 'MA'])
+# e.g. 'island', 'carlysle'
+S_ISLE = frozenset(['ISL', 'YSL'])
+S_GERMANIC = frozenset(['HEIM', 'HOEK', 'HOLM', 'HOLZ'])
+S_ITALIAN = frozenset(['SIO', 'SIA'])
+# e.g. 'school', 'schooner'
+S_DUTCH = frozenset(['OO', 'ER', 'EN', 'UY', 'ED', 'EM'])
+# e.g. 'schermerhorn', 'schenker'
+S_ER_EN = frozenset(['ER', 'EN'])
+# e.g. 'resnais', 'artois'
+S_FRENCH = frozenset(['AI', 'OI'])
+T_X_SOUND = frozenset(['TIA', 'TCH'])
+# e.g. 'thomas', 'thames'
+T_OM_AM = frozenset(['OM', 'AM'])
+W_SLAVIC = frozenset(['EWSKI', 'EWSKY', 'OWSKI', 'OWSKY'])
+# e.g. 'filipowicz'
+W_POLISH = frozenset(['WICZ', 'WITZ'])
+# e.g. 'breaux'
+X_FRENCH_LONG = frozenset(['IAU', 'EAU'])
+X_FRENCH_SHORT = frozenset(['AU', 'OU'])
+Z_SLAVIC = frozenset(['ZO', 'ZI', 'ZA'])
+# letters whose code depends only on whether they are doubled; "-mb", e.g.,
+# "dumb", is already skipped over by 'M'
+SIMPLE_DOUBLED = {
+    'B': 'P',
+    'F': 'F',
+    'K': 'K',
+    'N': 'N',
+    'Q': 'K',
+    'V': 'F',
+}
 
 
 class DoubleMetaphone(object):
     """
     """
+    # Prevent per-instance dictionaries to reduce memory
+    __slots__ = (
+        'position',
+        'primary_phone',
+        'secondary_phone',
+        'next_chars',
+        'word',
+    )
+
     def __init__(self):
         self.position = 0
-        self.primary_phone = ""
-        self.secondary_phone = ""
-        # next_chars is used set to a tuple of the next_chars characters in the primary and
-        # secondary codes and to indicate how many characters to move forward
-        # in the string.  The secondary code letter is given only when it is
-        # different than the primary. This is just a trick to make the code
-        # easier to write and read. The default action is to add nothing and
-        # move to next_chars char.
-        self.next_chars = (None, 1)
+        # codes are collected as lists of fragments and joined once at the
+        # end of parse rather than rebuilding a string on every append
+        self.primary_phone = []
+        self.secondary_phone = []
+        # next_chars is set to a (primary, secondary, advance) tuple: the
+        # characters to add to the primary and secondary codes and how many
+        # characters to move forward in the string. The secondary code is
+        # spelled out even when it is the same as the primary so parse can
+        # unpack every tuple the same way. The default action is to add
+        # nothing and move to the next char.
+        self.next_chars = (None, None, 1)
 
     def check_word_start(self):
+        buffer = self.word.buffer
+        start_index = self.word.start_index
         # skip these silent letters when at start of word
-        if self.word.get_letters(0, 2) in SILENT_STARTERS:
+        if buffer[start_index:start_index + 2] in SILENT_STARTERS:
             self.position += 1
         # Initial 'X' is pronounced 'Z' e.g. 'Xavier'
-        if self.word.get_letters(0) == 'X':
+        if buffer[start_index] == 'X':
             # 'Z' maps to 'S'
-            self.primary_phone = self.secondary_phone = 'S'
+            self.primary_phone.append('S')
+            self.secondary_phone.append('S')
             self.position += 1
 
     def process_initial_vowels(self):
-        # XXX do we need this next_chars set? it should already be done...
-        self.next_chars = (None, 1)
         # all init vowels now map to 'A'
         if self.position == self.word.start_index:
-            self.next_chars = ('A', 1)
-
-    def process_b(self):
-        # "-mb", e.g., "dumb", already skipped over... see 'M' below
-        if self.word.buffer[self.position + 1] == 'B':
-            self.next_chars = ('P', 2)
+            self.next_chars = ('A', 'A', 1)
         else:
-            self.next_chars = ('P', 1)
+            self.next_chars = (None, None, 1)
 
     def process_c(self):
         buffer = self.word.buffer
         position = self.position
         start_index = self.word.start_index
+        # slice the letters from 'C' onward once for the tests below
+        pair = buffer[position:position + 2]
+        window = buffer[position:position + 4]
         # various germanic
         if (position > start_index + 1
             and buffer[position - 2] not in VOWELS
             and buffer[position - 1:self.position + 2] == 'ACH'
-            and buffer[position + 2] not in ['I']
-            and (buffer[position + 2] not in ['E']
-                 or buffer[position - 2:position + 4] in [
-                    'BACHER', 'MACHER'])):
-            self.next_chars = ('K', 2)
+            and buffer[position + 2] != 'I'
+            and (buffer[position + 2] != 'E'
+                 or buffer[position - 2:position + 4] in C_ACHER)):
+            self.next_chars = ('K', 'K', 2)
         # special case 'CAESAR'
         elif (position == start_index
               and buffer[start_index:start_index + 6] == 'CAESAR'):
-            self.next_chars = ('S', 2)
+            self.next_chars = ('S', 'S', 2)
         # italian 'chianti'
-        elif buffer[position:position + 4] == 'CHIA':
-            self.next_chars = ('K', 2)
-        elif buffer[position:position + 2] == 'CH':
+        elif window == 'CHIA':
+            self.next_chars = ('K', 'K', 2)
+        elif pair == 'CH':
             # find 'michael'
             if (position > start_index
-                and buffer[position:position + 4] == 'CHAE'):
+                and window == 'CHAE'):
                 self.next_chars = ('K', 'X', 2)
             elif (position == start_index
-                  and (buffer[position + 1:position + 6] in ['HARAC', 'HARIS']
-                  or buffer[position + 1:position + 4] in ["HOR", "HYM", "HIA",
-                                                           "HEM"])
+                  and (buffer[position + 1:position + 6] in C_CH_GREEK_LONG
+                  or buffer[position + 1:position + 4] in C_CH_GREEK_SHORT)
                   and buffer[start_index:start_index + 5] != 'CHORE'):
-                self.next_chars = ('K', 2)
+                self.next_chars = ('K', 'K', 2)
             # germanic, greek, or otherwise 'ch' for 'kh' sound
             elif (
-                buffer[start_index:start_index + 4] in ['VAN ', 'VON ']
-                or buffer[start_index:start_index + 3] == 'SCH'
-                or buffer[position - 2:position + 4] in ["ORCHES", "ARCHIT",
-                                                         "ORCHID"]
-                or buffer[position + 2] in ['T', 'S']
+                self.word.starts_van_von
+                or self.word.starts_sch
+                or buffer[position - 2:position + 4] in C_CH_K_SOUND
+                or buffer[position + 2] in C_TS
                 or (
-                    (buffer[position - 1] in ["A", "O", "U", "E"]
+                    (buffer[position - 1] in C_BACK_VOWELS
                      or position == start_index)
-                    and (buffer[position + 2] in [
-                        "L", "R", "N", "M", "B", "H", "F", "V", "W"]))):
-                self.next_chars = ('K', 2)
+                    and buffer[position + 2] in C_CH_HARD_NEXT)):
+                self.next_chars = ('K', 'K', 2)
             else:
                 if position > start_index:
-                    if buffer[start_index:start_index + 2] == 'MC':
-                        self.next_chars = ('K', 2)
+                    if self.word.starts_mc:
+                        self.next_chars = ('K', 'K', 2)
                     else:
                         self.next_chars = ('X', 'K', 2)
                 else:
-                    self.next_chars = ('X', 2)
+                    self.next_chars = ('X', 'X', 2)
         # e.g, 'czerny'
-        elif (buffer[position:position + 2] == 'CZ'
+        elif (pair == 'CZ'
               and buffer[position - 2:position + 2] != 'WICZ'):
             self.next_chars = ('S', 'X', 2)
         # e.g., 'focaccia'
         elif buffer[position + 1:position + 4] == 'CIA':
-            self.next_chars = ('X', 3)
+            self.next_chars = ('X', 'X', 3)
         # double 'C', but not if e.g. 'McClellan'
         elif (
-            buffer[position:position + 2] == 'CC'
+            pair == 'CC'
             and not (position == (start_index + 1)
                      and buffer[start_index] == 'M')):
             #'bellocchio' but not 'bacchus'
-            if (buffer[position + 2] in ["I", "E", "H"]
+            if (buffer[position + 2] in C_IEH
                 and buffer[position + 2:position + 4] != 'HU'):
                 # 'accident', 'accede' 'succeed'
                 if (
                     (position == (start_index + 1)
                      and buffer[start_index] == 'A')
-                    or buffer[position - 1:position + 4] in [
-                        'UCCEE', 'UCCES']):
-                    self.next_chars = ('KS', 3)
+                    or buffer[position - 1:position + 4] in C_UCCE):
+                    self.next_chars = ('KS', 'KS', 3)
                 # 'bacci', 'bertucci', other italian
                 else:
-                    self.next_chars = ('X', 3)
+                    self.next_chars = ('X', 'X', 3)
             else:
-                self.next_chars = ('K', 2)
-        elif buffer[position:position + 2] in ["CK", "CG", "CQ"]:
-            self.next_chars = ('K', 2)
-        elif buffer[position:position + 2] in ["CI", "CE", "CY"]:
+                self.next_chars = ('K', 'K', 2)
+        elif pair in C_HARD_PAIRS:
+            self.next_chars = ('K', 'K', 2)
+        elif pair in C_SOFT_PAIRS:
             # italian vs. english
-            if buffer[position:position + 3] in ["CIO", "CIE", "CIA"]:
+            if buffer[position:position + 3] in C_ITALIAN:
                 self.next_chars = ('S', 'X', 2)
             else:
-                self.next_chars = ('S', 2)
+                self.next_chars = ('S', 'S', 2)
         else:
             # name sent in 'mac caffrey', 'mac gregor'
-            if buffer[position + 1:position + 3] in [" C", " Q", " G"]:
-                self.next_chars = ('K', 3)
+            if buffer[position + 1:position + 3] in C_MAC_SPACED:
+                self.next_chars = ('K', 'K', 3)
             else:
-                if (buffer[position + 1] in ["C", "K", "Q"]
-                    and buffer[position + 1:position + 3] not in ["CE", "CI"]):
-                    self.next_chars = ('K', 2)
+                if (buffer[position + 1] in C_CKQ
+                    and buffer[position + 1:position + 3] not in C_CE_CI):
+                    self.next_chars = ('K', 'K', 2)
                 # default for 'C'
                 else:
-                    self.next_chars = ('K', 1)
+                    self.next_chars = ('K', 'K', 1)
 
     def process_d(self):
         if self.word.buffer[self.position:self.position + 2] == 'DG':
             # e.g. 'edge'
-            if self.word.buffer[self.position + 2] in ['I', 'E', 'Y']:
-                self.next_chars = ('J', 3)
+            if self.word.buffer[self.position + 2] in FRONT_VOWELS:
+                self.next_chars = ('J', 'J', 3)
             else:
-                self.next_chars = ('TK', 2)
-        elif self.word.buffer[self.position:self.position + 2] in ['DT', 'DD']:
-            self.next_chars = ('T', 2)
+                self.next_chars = ('TK', 'TK', 2)
+        elif self.word.buffer[self.position:self.position + 2] in D_T_PAIRS:
+            self.next_chars = ('T', 'T', 2)
         else:
-            self.next_chars = ('T', 1)
-
-    def process_f(self):
-        if self.word.buffer[self.position + 1] == 'F':
-            self.next_chars = ('F', 2)
-        else:
-            self.next_chars = ('F', 1)
+            self.next_chars = ('T', 'T', 1)
 
     def process_g(self):
         buffer = self.word.buffer
         position = self.position
         start_index = self.word.start_index
+        # the two letters after 'G' are tested by most branches below
+        following = buffer[position + 1:position + 3]
         if buffer[position + 1] == 'H':
             if (position > start_index
                 and buffer[position - 1] not in VOWELS):
-                self.next_chars = ('K', 2)
+                self.next_chars = ('K', 'K', 2)
             elif position < (start_index + 3):
                 # 'ghislane', ghiradelli
                 if position == start_index:
                     if buffer[position + 2] == 'I':
-                        self.next_chars = ('J', 2)
+                        self.next_chars = ('J', 'J', 2)
                     else:
-                        self.next_chars = ('K', 2)
+                        self.next_chars = ('K', 'K', 2)
             # Parker's rule (with some further refinements) - e.g., 'hugh'
             elif (
                 (position > (start_index + 1)
-                 and buffer[position - 2] in ['B', 'H', 'D'])
+                 and buffer[position - 2] in G_BHD)
                 or (position > (start_index + 2)
-                 and buffer[position - 3] in ['B', 'H', 'D'])
+                 and buffer[position - 3] in G_BHD)
                 or (position > (start_index + 3)
-                 and buffer[position - 4] in ['B', 'H'])):
-                self.next_chars = (None, 2)
+                 and buffer[position - 4] in G_BH)):
+                self.next_chars = (None, None, 2)
             else:
                 # e.g., 'laugh', 'McLaughlin', 'cough', 'gough', 'rough',
                 # 'tough'
                 if (position > (start_index + 2)
                     and buffer[position - 1] == 'U'
-                    and buffer[position - 3] in [
-                        "C", "G", "L", "R", "T"]):
-                    self.next_chars = ('F', 2)
+                    and buffer[position - 3] in G_CGLRT):
+                    self.next_chars = ('F', 'F', 2)
                 else:
                     if (position > start_index
                         and buffer[position - 1] != 'I'):
-                        self.next_chars = ('K', 2)
+                        self.next_chars = ('K', 'K', 2)
         elif buffer[position + 1] == 'N':
             if (position == (start_index + 1)
                 and buffer[start_index] in VOWELS
@@ -297,101 +386,87 @@ class DoubleMetaphone(object):
                     and not self.word.is_slavo_germanic):
                     self.next_chars = ('N', 'KN', 2)
                 else:
-                    self.next_chars = ('KN', 2)
+                    self.next_chars = ('KN', 'KN', 2)
         # 'tagliaro'
-        elif (buffer[position + 1:position + 3] == 'LI'
+        elif (following == 'LI'
               and not self.word.is_slavo_germanic):
             self.next_chars = ('KL', 'L', 2)
         # -ges-,-gep-,-gel-, -gie- at beginning
         elif (position == start_index
               and (buffer[position + 1] == 'Y'
-              or buffer[position + 1:position + 3] in [
-                "ES", "EP", "EB", "EL", "EY", "IB", "IL", "IN", "IE", "EI",
-                "ER"])):
+              or following in G_SOFT_START)):
             self.next_chars = ('K', 'J', 2)
         # -ger-,  -gy-
         elif (
-            (buffer[position + 1:position + 3] == 'ER'
+            (following == 'ER'
              or buffer[position + 1] == 'Y')
-            and buffer[start_index:start_index + 6] not in [
-                "DANGER", "RANGER", "MANGER"]
-            and buffer[position - 1] not in ['E', 'I']
-            and buffer[position - 1:position + 2] not in ['RGY', 'OGY']):
+            and buffer[start_index:start_index + 6] not in G_ANGER
+            and buffer[position - 1] not in G_EI
+            and buffer[position - 1:position + 2] not in G_GY):
             self.next_chars = ('K', 'J', 2)
         # italian e.g, 'biaggi'
         elif (
-            buffer[position + 1] in ['E', 'I', 'Y']
-            or buffer[position - 1:position + 3] in [
-                "AGGI", "OGGI"]):
+            buffer[position + 1] in FRONT_VOWELS
+            or buffer[position - 1:position + 3] in G_ITALIAN):
             # obvious germanic
-            if (buffer[start_index:start_index + 4] in ['VON ', 'VAN ']
-                or buffer[start_index:start_index + 3] == 'SCH'
-                or buffer[position + 1:position + 3] == 'ET'):
-                self.next_chars = ('K', 2)
+            if (self.word.starts_van_von
+                or self.word.starts_sch
+                or following == 'ET'):
+                self.next_chars = ('K', 'K', 2)
             else:
                 # always soft if french ending
                 if buffer[position + 1:position + 5] == 'IER ':
-                    self.next_chars = ('J', 2)
+                    self.next_chars = ('J', 'J', 2)
                 else:
                     self.next_chars = ('J', 'K', 2)
         elif buffer[position + 1] == 'G':
-            self.next_chars = ('K', 2)
+            self.next_chars = ('K', 'K', 2)
         else:
-            self.next_chars = ('K', 1)
+            self.next_chars = ('K', 'K', 1)
 
     def process_h(self):
         # only keep if self.word.start_index & before vowel or btw. 2 vowels
         if ((self.position == self.word.start_index
              or self.word.buffer[self.position - 1] in VOWELS)
             and self.word.buffer[self.position + 1] in VOWELS):
-            self.next_chars = ('H', 2)
+            self.next_chars = ('H', 'H', 2)
         # (also takes care of 'HH')
         else:
-            self.next_chars = (None, 1)
+            self.next_chars = (None, None, 1)
 
     def process_j(self):
         buffer = self.word.buffer
         position = self.position
         start_index = self.word.start_index
+        advance = 2 if buffer[position + 1] == 'J' else 1
         # obvious spanish, 'jose', 'san jacinto'
         if (buffer[self.position:self.position + 4] == 'JOSE'
             or buffer[start_index:start_index + 4] == 'SAN '):
             if (
                 (position == start_index and buffer[position + 4] == ' ')
                 or buffer[start_index:start_index + 4] == 'SAN '):
-                self.next_chars = ('H', )
+                self.next_chars = ('H', 'H', advance)
             else:
-                self.next_chars = ('J', 'H')
+                self.next_chars = ('J', 'H', advance)
         # Yankelovich/Jankelowicz
         elif (position == start_index
               and buffer[self.position:self.position + 4] != 'JOSE'):
-            self.next_chars = ('J', 'A')
+            self.next_chars = ('J', 'A', advance)
         else:
             # spanish pron. of e.g. 'bajador'
             if (buffer[position - 1] in VOWELS
                 and not self.word.is_slavo_germanic
-                and buffer[position + 1] in ['A', 'O']):
-                self.next_chars = ('J', 'H')
+                and buffer[position + 1] in AO):
+                self.next_chars = ('J', 'H', advance)
             else:
                 if position == self.word.end_index:
-                    self.next_chars = ('J', ' ')
+                    self.next_chars = ('J', ' ', advance)
                 else:
-                    if (buffer[position + 1] not in ["L", "T", "K", "S", "N",
-                                               "M", "B", "Z"]
-                        and buffer[position - 1] not in ["S", "K", "L"]):
-                        self.next_chars = ('J',)
+                    if (buffer[position + 1] not in J_SILENT_NEXT
+                        and buffer[position - 1] not in J_SILENT_PREV):
+                        self.next_chars = ('J', 'J', advance)
                     else:
-                        self.next_chars = (None, )
-        if buffer[position + 1] == 'J':
-            self.next_chars = self.next_chars + (2,)
-        else:
-            self.next_chars = self.next_chars + (1,)
-
-    def process_k(self):
-        if self.word.buffer[self.position + 1] == 'K':
-            self.next_chars = ('K', 2)
-        else:
-            self.next_chars = ('K', 1)
+                        self.next_chars = (None, None, advance)
 
     def process_l(self):
         buffer = self.word.buffer
@@ -400,16 +475,15 @@ class DoubleMetaphone(object):
         if buffer[position + 1] == 'L':
             # spanish e.g. 'cabrillo', 'gallegos'
             if ((position == (end_index - 2)
-                 and buffer[position - 1:position + 3] in [
-                    "ILLO", "ILLA", "ALLE"])
-                or ((buffer[end_index - 1:end_index + 1] in ["AS", "OS"]
-                     or buffer[end_index] in ["A", "O"])
+                 and buffer[position - 1:position + 3] in L_SPANISH)
+                or ((buffer[end_index - 1:end_index + 1] in L_SPANISH_ENDINGS
+                     or buffer[end_index] in AO)
                     and buffer[position - 1:position + 3] == 'ALLE')):
                 self.next_chars = ('L', '', 2)
             else:
-                self.next_chars = ('L', 2)
+                self.next_chars = ('L', 'L', 2)
         else:
-            self.next_chars = ('L', 1)
+            self.next_chars = ('L', 'L', 1)
 
     def process_m(self):
         buffer = self.word.buffer
@@ -418,47 +492,32 @@ class DoubleMetaphone(object):
              and (position + 1 == self.word.end_index
                   or buffer[position + 2:position + 4] == 'ER'))
             or buffer[position + 1] == 'M'):
-            self.next_chars = ('M', 2)
-        else:
-            self.next_chars = ('M', 1)
-
-    def process_n(self):
-        if self.word.buffer[self.position + 1] == 'N':
-            self.next_chars = ('N', 2)
+            self.next_chars = ('M', 'M', 2)
         else:
-            self.next_chars = ('N', 1)
+            self.next_chars = ('M', 'M', 1)
 
     def process_p(self):
         if self.word.buffer[self.position + 1] == 'H':
-            self.next_chars = ('F', 2)
+            self.next_chars = ('F', 'F', 2)
         # also account for "campbell", "raspberry"
-        elif self.word.buffer[self.position + 1] in ['P', 'B']:
-            self.next_chars = ('P', 2)
-        else:
-            self.next_chars = ('P', 1)
-
-    def process_q(self):
-        if self.word.buffer[self.position + 1] == 'Q':
-            self.next_chars = ('K', 2)
+        elif self.word.buffer[self.position + 1] in P_PB:
+            self.next_chars = ('P', 'P', 2)
         else:
-            self.next_chars = ('K', 1)
+            self.next_chars = ('P', 'P', 1)
 
     def process_r(self):
         buffer = self.word.buffer
         position = self.position
         end_index = self.word.end_index
+        advance = 2 if buffer[position + 1] == 'R' else 1
         # french e.g. 'rogier', but exclude 'hochmeier'
         if (position == end_index
             and not self.word.is_slavo_germanic
             and buffer[position - 2:position] == 'IE'
-            and buffer[position - 4:position - 2] not in ['ME', 'MA']):
-            self.next_chars = ('', 'R')
+            and buffer[position - 4:position - 2] not in R_ME_MA):
+            self.next_chars = ('', 'R', advance)
         else:
-            self.next_chars = ('R',)
-        if buffer[position + 1] == 'R':
-            self.next_chars = self.next_chars + (2,)
-        else:
-            self.next_chars = self.next_chars + (1,)
+            self.next_chars = ('R', 'R', advance)
 
     def process_s(self):
         buffer = self.word.buffer
@@ -466,97 +525,86 @@ class DoubleMetaphone(object):
         start_index = self.word.start_index
         end_index = self.word.end_index
         # special cases 'island', 'isle', 'carlisle', 'carlysle'
-        if buffer[position - 1:position + 2] in ['ISL', 'YSL']:
-            self.next_chars = (None, 1)
+        if buffer[position - 1:position + 2] in S_ISLE:
+            self.next_chars = (None, None, 1)
         # special case 'sugar-'
         elif (position == start_index
               and buffer[start_index:start_index + 5] == 'SUGAR'):
             self.next_chars = ('X', 'S', 1)
         elif buffer[position:position + 2] == 'SH':
             # germanic
-            if buffer[position + 1:position + 5] in [
-                "HEIM", "HOEK", "HOLM", "HOLZ"]:
-                self.next_chars = ('S', 2)
+            if buffer[position + 1:position + 5] in S_GERMANIC:
+                self.next_chars = ('S', 'S', 2)
             else:
-                self.next_chars = ('X', 2)
+                self.next_chars = ('X', 'X', 2)
         # italian & armenian
-        elif (buffer[position:position + 3] in ["SIO", "SIA"]
+        elif (buffer[position:position + 3] in S_ITALIAN
               or buffer[position:position + 4] == 'SIAN'):
             if not self.word.is_slavo_germanic:
                 self.next_chars = ('S', 'X', 3)
             else:
-                self.next_chars = ('S', 3)
+                self.next_chars = ('S', 'S', 3)
         # german & anglicisations, e.g. 'smith' match 'schmidt', 'snider'
         # match 'schneider' also, -sz- in slavic language altho in
         # hungarian it is pronounced 's'
         elif ((position == start_index
-               and buffer[position + 1] in ["M", "N", "L", "W"])
+               and buffer[position + 1] in S_MNLW)
               or buffer[position + 1] == 'Z'):
-            self.next_chars = ('S', 'X')
             if buffer[position + 1] == 'Z':
-                self.next_chars = self.next_chars + (2,)
+                self.next_chars = ('S', 'X', 2)
             else:
-                self.next_chars = self.next_chars + (1,)
+                self.next_chars = ('S', 'X', 1)
         elif buffer[position:position + 2] == 'SC':
             # Schlesinger's rule
             if buffer[position + 2] == 'H':
                 # dutch origin, e.g. 'school', 'schooner'
-                if buffer[position + 3:position + 5] in [
-                    "OO", "ER", "EN", "UY", "ED", "EM"]:
+                if buffer[position + 3:position + 5] in S_DUTCH:
                     # 'schermerhorn', 'schenker'
-                    if buffer[position + 3:position + 5] in ['ER', 'EN']:
+                    if buffer[position + 3:position + 5] in S_ER_EN:
                         self.next_chars = ('X', 'SK', 3)
                     else:
-                        self.next_chars = ('SK', 3)
+                        self.next_chars = ('SK', 'SK', 3)
                 else:
                     if (position == start_index
                         and buffer[start_index + 3] not in VOWELS
                         and buffer[start_index + 3] != 'W'):
                         self.next_chars = ('X', 'S', 3)
                     else:
-                        self.next_chars = ('X', 3)
-            elif buffer[position + 2] in ['I', 'E', 'Y']:
-                self.next_chars = ('S', 3)
+                        self.next_chars = ('X', 'X', 3)
+            elif buffer[position + 2] in FRONT_VOWELS:
+                self.next_chars = ('S', 'S', 3)
             else:
-                self.next_chars = ('SK', 3)
+                self.next_chars = ('SK', 'SK', 3)
         # french e.g. 'resnais', 'artois'
         elif (position == end_index
-              and buffer[position - 2:position] in ['AI', 'OI']):
+              and buffer[position - 2:position] in S_FRENCH):
             self.next_chars = ('', 'S', 1)
         else:
-            self.next_chars = ('S', )
-            if buffer[position + 1] in ['S', 'Z']:
-                self.next_chars = self.next_chars + (2,)
+            if buffer[position + 1] in S_SZ:
+                self.next_chars = ('S', 'S', 2)
             else:
-                self.next_chars = self.next_chars + (1,)
+                self.next_chars = ('S', 'S', 1)
 
     def process_t(self):
         buffer = self.word.buffer
         position = self.position
-        start_index = self.word.start_index
         if buffer[position:position + 4] == 'TION':
-            self.next_chars = ('X', 3)
-        elif buffer[position:position + 3] in ['TIA', 'TCH']:
-            self.next_chars = ('X', 3)
+            self.next_chars = ('X', 'X', 3)
+        elif buffer[position:position + 3] in T_X_SOUND:
+            self.next_chars = ('X', 'X', 3)
         elif (buffer[position:position + 2] == 'TH'
               or buffer[position:position + 3] == 'TTH'):
             # special case 'thomas', 'thames' or germanic
-            if (buffer[position + 2:position + 4] in ['OM', 'AM']
-                or buffer[start_index:start_index + 4] in ['VON ', 'VAN ']
-                or buffer[start_index:start_index + 3] == 'SCH'):
-                self.next_chars = ('T', 2)
+            if (buffer[position + 2:position + 4] in T_OM_AM
+                or self.word.starts_van_von
+                or self.word.starts_sch):
+                self.next_chars = ('T', 'T', 2)
             else:
                 self.next_chars = ('0', 'T', 2)
-        elif buffer[position + 1] in ['T', 'D']:
-            self.next_chars = ('T', 2)
+        elif buffer[position + 1] in T_TD:
+            self.next_chars = ('T', 'T', 2)
         else:
-            self.next_chars = ('T', 1)
-
-    def process_v(self):
-        if self.word.buffer[self.position + 1] == 'V':
-            self.next_chars = ('F', 2)
-        else:
-            self.next_chars = ('F', 1)
+            self.next_chars = ('T', 'T', 1)
 
     def process_w(self):
         buffer = self.word.buffer
@@ -564,7 +612,7 @@ class DoubleMetaphone(object):
         start_index = self.word.start_index
         # can also be in middle of word
         if buffer[position:position + 2] == 'WR':
-            self.next_chars = ('R', 2)
+            self.next_chars = ('R', 'R', 2)
         elif (position == start_index
             and (buffer[position + 1] in VOWELS
                  or buffer[position:position + 2] == 'WH')):
@@ -572,130 +620,173 @@ class DoubleMetaphone(object):
             if buffer[position + 1] in VOWELS:
                 self.next_chars = ('A', 'F', 1)
             else:
-                self.next_chars = ('A', 1)
+                self.next_chars = ('A', 'A', 1)
         # Arnow should match Arnoff
         elif ((position == self.word.end_index
                and buffer[position - 1] in VOWELS)
-              or buffer[position - 1:position + 4] in [
-                "EWSKI", "EWSKY", "OWSKI", "OWSKY"]
-              or buffer[start_index:start_index + 3] == 'SCH'):
+              or buffer[position - 1:position + 4] in W_SLAVIC
+              or self.word.starts_sch):
             self.next_chars = ('', 'F', 1)
         # polish e.g. 'filipowicz'
-        elif buffer[position:position + 4] in ["WICZ", "WITZ"]:
+        elif buffer[position:position + 4] in W_POLISH:
             self.next_chars = ('TS', 'FX', 4)
         else:  # default is to skip it
-            self.next_chars = (None, 1)
+            self.next_chars = (None, None, 1)
 
     def process_x(self):
         buffer = self.word.buffer
         position = self.position
+        advance = 2 if buffer[position + 1] in X_CX else 1
         # french e.g. breaux
-        self.next_chars = (None, )
         if not (
             position == self.word.end_index
-            and (buffer[position - 3:position] in ["IAU", "EAU"]
-                 or buffer[position - 2:position] in ['AU', 'OU'])):
-            self.next_chars = ('KS',)
-        if buffer[position + 1] in ['C', 'X']:
-            self.next_chars = self.next_chars + (2,)
+            and (buffer[position - 3:position] in X_FRENCH_LONG
+                 or buffer[position - 2:position] in X_FRENCH_SHORT)):
+            self.next_chars = ('KS', 'KS', advance)
         else:
-            self.next_chars = self.next_chars + (1,)
+            self.next_chars = (None, None, advance)
 
     def process_z(self):
+        if (self.word.buffer[self.position + 1] == 'Z'
+            or self.word.buffer[self.position + 1] == 'H'):
+            advance = 2
+        else:
+            advance = 1
         # chinese pinyin e.g. 'zhao'
         if self.word.buffer[self.position + 1] == 'H':
-            self.next_chars = ('J', )
+            self.next_chars = ('J', 'J', advance)
         elif (
-            self.word.buffer[self.position + 1:self.position + 3] in [
-                "ZO", "ZI", "ZA"]
+            self.word.buffer[self.position + 1:self.position + 3] in Z_SLAVIC
             or (self.word.is_slavo_germanic
                 and self.position > self.word.start_index
                 and self.word.buffer[self.position - 1] != 'T')):
-            self.next_chars = ('S', 'TS')
+            self.next_chars = ('S', 'TS', advance)
         else:
-            self.next_chars = ('S', )
-        if (self.word.buffer[self.position + 1] == 'Z'
-            or self.word.buffer[self.position + 1] == 'H'):
-            self.next_chars = self.next_chars + (2,)
-        else:
-            self.next_chars = self.next_chars + (1,)
+            self.next_chars = ('S', 'S', advance)
 
     def parse(self, input):
+        # a parser may be reused, so start every word from a clean state
+        self.primary_phone = []
+        self.secondary_phone = []
+        self.next_chars = (None, None, 1)
         self.word = Word(input)
         self.position = self.word.start_index
         self.check_word_start()
+        # the word is fixed for the whole loop, so bind what it reads once
+        buffer = self.word.buffer
+        start_index = self.word.start_index
+        end_index = self.word.end_index
+        add_primary = self.primary_phone.append
+        add_secondary = self.secondary_phone.append
+        dispatch = self._dispatch
         # loop through chars in word.buffer
-        while self.position <= self.word.end_index:
-            character = self.word.buffer[self.position]
+        while self.position <= end_index:
+            character = buffer[self.position]
             if character in VOWELS:
+                if self.position != start_index:
+                    # vowels after the first letter emit nothing, so step
+                    # over the whole run at once
+                    position = self.position + 1
+                    while buffer[position] in VOWELS:
+                        position += 1
+                    self.next_chars = (None, None, 1)
+                    self.position = position
+                    continue
                 self.process_initial_vowels()
             elif character == ' ':
                 self.position += 1
                 continue
-            elif character == 'B':
-                self.process_b()
-            elif character == 'C':
-                self.process_c()
-            elif character == 'D':
-                self.process_d()
-            elif character == 'F':
-                self.process_f()
-            elif character == 'G':
-                self.process_g()
-            elif character == 'H':
-                self.process_h()
-            elif character == 'J':
-                self.process_j()
-            elif character == 'K':
-                self.process_k()
-            elif character == 'L':
-                self.process_l()
-            elif character == 'M':
-                self.process_m()
-            elif character == 'N':
-                self.process_n()
-            elif character == 'P':
-                self.process_p()
-            elif character == 'Q':
-                self.process_q()
-            elif character == 'R':
-                self.process_r()
-            elif character == 'S':
-                self.process_s()
-            elif character == 'T':
-                self.process_t()
-            elif character == 'V':
-                self.process_v()
-            elif character == 'W':
-                self.process_w()
-            elif character == 'X':
-                self.process_x()
-            elif character == 'Z':
-                self.process_z()
-            if len(self.next_chars) == 2:
-                if self.next_chars[0]:
-                    self.primary_phone += self.next_chars[0]
-                    self.secondary_phone += self.next_chars[0]
-                self.position += self.next_chars[1]
-            elif len(self.next_chars) == 3:
-                if self.next_chars[0]:
-                    self.primary_phone += self.next_chars[0]
-                if self.next_chars[1]:
-                    self.secondary_phone += self.next_chars[1]
-                self.position += self.next_chars[2]
-        if self.primary_phone == self.secondary_phone:
-            self.secondary_phone = ""
-        return (self.primary_phone, self.secondary_phone)
-
-
-# backwards compatibility for the pre-OO implementation
+            elif character in SIMPLE_DOUBLED:
+                code = SIMPLE_DOUBLED[character]
+                add_primary(code)
+                add_secondary(code)
+                if buffer[self.position + 1] == character:
+                    self.next_chars = (code, code, 2)
+                    self.position += 2
+                else:
+                    self.next_chars = (code, code, 1)
+                    self.position += 1
+                continue
+            else:
+                handler = dispatch.get(character)
+                if handler is not None:
+                    handler(self)
+            primary, secondary, advance = self.next_chars
+            if primary:
+                add_primary(primary)
+            if secondary:
+                add_secondary(secondary)
+            self.position += advance
+        primary_phone = ''.join(self.primary_phone)
+        secondary_phone = ''.join(self.secondary_phone)
+        if primary_phone == secondary_phone:
+            secondary_phone = ""
+        return (primary_phone, secondary_phone)
+
+    # Handler for each consonant, looked up once per character by parse
+    _dispatch = {
+        'C': process_c,
+        'D': process_d,
+        'G': process_g,
+        'H': process_h,
+        'J': process_j,
+        'L': process_l,
+        'M': process_m,
+        'P': process_p,
+        'R': process_r,
+        'S': process_s,
+        'T': process_t,
+        'W': process_w,
+        'X': process_x,
+        'Z': process_z,
+    }
+
+
+# initials and two-letter names are common, so encode every ASCII one- and
+# two-letter name up front; these are never evicted from the cache
+_SHORT_CODES = dict(
+    (name, DoubleMetaphone().parse(name))
+    for name in list(ascii_uppercase) + [first + second
+                                         for first in ascii_uppercase
+                                         for second in ascii_uppercase])
+
+
+# parse resets all parser state, so each thread keeps one parser for every
+# word it encodes instead of building a new one per call
+_local = threading.local()
+
+
+def _parser():
+    try:
+        return _local.parser
+    except AttributeError:
+        _local.parser = DoubleMetaphone()
+        return _local.parser
+
+
+# backwards compatibility for the pre-OO implementation; names repeat heavily
+# across a population, so recent encodings are remembered
+@lru_cache(maxsize=1 << 16)
 def doublemetaphone(input):
     """
     Given an input string, return a 2-tuple of the double metaphone codes for
     the provided string. The second element of the tuple will be an empty
     string if it is identical to the first element.
     """
-    return DoubleMetaphone().parse(input)
+    if len(input) <= 2:
+        codes = _SHORT_CODES.get(input.upper())
+        if codes is not None:
+            return codes
+    return _parser().parse(input)
+
+
+def encode_batch(names):
+    """
+    Given an iterable of input strings, return a list with the 2-tuple of
+    double metaphone codes for each, in the same order. Repeated names are
+    only parsed once.
+    """
+    return [doublemetaphone(name) for name in names]
 
 
 # for backwards compatibility for the old name of the function
@@ -43,40 +43,80 @@ from __future__ import unicode_literals
 import unicodedata
 
 
+class _CombiningMarks(dict):
+    """Translation table for unicode.translate that deletes combining marks
+    (category Mn) and leaves every other character as is. Entries are filled
+    in on first use rather than for every code point at import.
+    """
+    def __missing__(self, codepoint):
+        if unicodedata.category(chr(codepoint)) == 'Mn':
+            self[codepoint] = None
+        else:
+            self[codepoint] = codepoint
+        return self[codepoint]
+
+
+_COMBINING_MARKS = _CombiningMarks()
+# 'Ç' and 'ç' are encoded as 's' rather than losing their cedilla to NFD
+_C_CEDILLA = {0xc7: 's', 0xe7: 's'}
+
+
 class Word(object):
     """
     """
+    # Prevent per-instance dictionaries to reduce memory
+    __slots__ = (
+        'original',
+        'decoded',
+        'normalized',
+        'upper',
+        'length',
+        'prepad',
+        'start_index',
+        'end_index',
+        'postpad',
+        'buffer',
+        'starts_sch',
+        'starts_van_von',
+        'starts_mc',
+        'is_slavo_germanic',
+    )
+
     def __init__(self, input):
         self.original = input
         if isinstance(input, bytes):
             self.decoded = input.decode('utf-8', 'ignore')
         else:
             self.decoded = input
-        self.decoded = self.decoded.replace('\xc7', "s")
-        self.decoded = self.decoded.replace('\xe7', "s")
-        self.normalized = ''.join(
-            (c for c in unicodedata.normalize('NFD', self.decoded)
-            if unicodedata.category(c) != 'Mn'))
+        if self.decoded.isascii():
+            # ASCII is already in NFD form and has no combining marks
+            self.normalized = self.decoded
+        else:
+            self.decoded = self.decoded.translate(_C_CEDILLA)
+            self.normalized = unicodedata.normalize(
+                'NFD', self.decoded).translate(_COMBINING_MARKS)
         self.upper = self.normalized.upper()
         self.length = len(self.upper)
-        self.prepad = "--"
+        # so we can index beyond the begining and end of the input string;
+        # the process_* methods look at most 4 characters behind and 5 ahead,
+        # so every such index lands on padding rather than wrapping around
+        self.prepad = "-----"
         self.start_index = len(self.prepad)
         self.end_index = self.start_index + self.length - 1
         self.postpad = "------"
-        # so we can index beyond the begining and end of the input string
-        self.buffer = self.prepad + self.upper + self.postpad
-
-    @property
-    def is_slavo_germanic(self):
-        return (
-            self.upper.find('W') > -1
-            or self.upper.find('K') > -1
-            or self.upper.find('CZ') > -1
-            or self.upper.find('WITZ') > -1)
+        self.buffer = ''.join((self.prepad, self.upper, self.postpad))
+        # word-level prefixes several process_* rules test at every position
+        self.starts_sch = self.upper.startswith('SCH')
+        self.starts_van_von = self.upper[:4] in ('VAN ', 'VON ')
+        self.starts_mc = self.upper.startswith('MC')
+        # 'WITZ' is also slavo-germanic but is already covered by 'W'
+        self.is_slavo_germanic = (
+            'W' in self.upper
+            or 'K' in self.upper
+            or 'CZ' in self.upper)
 
     def get_letters(self, start=0, end=None):
-        if not end:
+        if end is None:
             end = start + 1
-        start = self.start_index + start
-        end = self.start_index + end
-        return self.buffer[start:end]
+        start_index = self.start_index
+        return self.buffer[start_index + start:start_index + end]
@@ -2,10 +2,7 @@
 # -*- coding: utf-8 -*-
 
 
-try:
-    from setuptools import setup
-except ImportError:
-    from distutils.core import setup
+from setuptools import setup
 
 
 with open('README.rst') as readme_file:
@@ -16,14 +13,11 @@ with open('HISTORY.rst') as history_file:
 
 requirements = [
     'jellyfish',
-    'backport_collections',
     'numpy',
-    'pylev',
 ]
 
 test_requirements = [
-   'fake-factory',
-   'unittest2',
+   'Faker',
    'sphinx',
    'sphinx_rtd_theme',
 ]
@@ -51,14 +45,15 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: ISC License (ISCL)',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
+    python_requires='>=3.8',
     test_suite='tests',
     tests_require=test_requirements,
-    use_2to3=True
 )
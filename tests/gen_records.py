@@ -10,11 +10,18 @@ import sys
 import re
 import json
 import argparse
-import random
+from operator import itemgetter
+
+import numpy as np
 from faker import Faker
 
 fake = Faker()
 
+ADDRESS_SPLIT = re.compile('[\n,]')
+BLOOD_TYPES = ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-')
+ADDRESS2_DELIMITERS = ('Suite', 'Ste', 'Unit', 'Apartment', 'Apt',
+                       'Department', 'Dpt')
+
 # Parse arguments
 argparser = argparse.ArgumentParser()
 argparser.add_argument("f", metavar="filename",
@@ -35,6 +42,25 @@ argparser.add_argument("--end_date", required=False,
 args = argparser.parse_args()
 
 
+def random_dates(N, start_date, end_date):
+    """Draws N random dates between two offsets from today.
+
+    Args:
+        N (int): Number of dates to draw.
+        start_date (str): Earliest date, in the form of
+            ``+/-<number of years>y``.
+        end_date (str): Latest date, in the same format as ``start_date``.
+
+    Returns:
+        list: N dates as strings in the form of ``YYYY-MM-DD``.
+    """
+    today = np.datetime64('today', 'D').astype(np.int64)
+    start = today + int(round(int(start_date.rstrip('y')) * 365.25))
+    end = today + int(round(int(end_date.rstrip('y')) * 365.25))
+    days = np.random.randint(start, end + 1, N)
+    return days.astype('datetime64[D]').astype(str).tolist()
+
+
 def create_population(N, start_date, end_date):
     """Creates a fake population.
 
@@ -53,18 +79,26 @@ def create_population(N, start_date, end_date):
         tuple: A tuple of dictionaries, each representing an individual profile,
         sorted by profile name.
     """
-    profile_fields = ['address', 'ssn', 'blood_group']
-    population = [fake.profile(fields=profile_fields) for i in range(N)]
+    # Only the address and SSN are needed from Faker, so call those providers
+    # directly rather than building a whole fake.profile() for each record
+    population = [{'address': fake.address(), 'national_id1': fake.ssn()}
+                  for i in range(N)]
+    blood_types = np.random.choice(BLOOD_TYPES, N).tolist()
     gender_change = {'M': 'F', 'F': 'M'}
+    birthdates = random_dates(N, start_date, end_date)
+    # Draw every record's sex, middle name, marriage and gender change at once
+    is_female = (np.random.random(N) <= 0.60).tolist()
+    has_middle_names = (np.random.random(N) <= 0.50).tolist()
+    are_married = (np.random.random(N) <= 0.49).tolist()
+    changes_gender = (np.random.random(N) < 0.05).tolist()
     for i in range(N):
         record = population[i]
         # Birthdate
-        birthdate = fake.date_time_between(start_date="-99y", end_date="-1y")
-        record['birthdate'] = birthdate.strftime("%Y-%m-%d")
+        record['birthdate'] = birthdates[i]
         # Name, Sex, and Gender
-        record['sex'] = 'F' if random.random() <= 0.60 else 'M'
-        has_middle_name = True if random.random() <= 0.50 else False
-        is_married = True if random.random() <= 0.49 else False
+        record['sex'] = 'F' if is_female[i] else 'M'
+        has_middle_name = has_middle_names[i]
+        is_married = are_married[i]
         sex = record['sex']
         if sex == 'F':
             record['forename'] = fake.first_name_female()
@@ -77,36 +111,29 @@ def create_population(N, start_date, end_date):
             record['forename'] = fake.first_name_male()
             record['mid_forename'] = fake.last_name() if has_middle_name else ''
             record['current_surname'] = fake.last_name_male()
-        record['gender'] = gender_change[sex] if random.random() < 0.05 else sex
+        record['gender'] = gender_change[sex] if changes_gender[i] else sex
         # Do some manipulation of keys to match expected Profile fields
         address = record.pop('address')
-        address = re.split('[\n,]', address)
+        address = ADDRESS_SPLIT.split(address)
         record['state_province'] = next(s for s in address[-1].split(' ') if s)
         record['postal_code'] = address[-1].split(' ')[-1]
         record['city'] = address[1]
         record['address1'] = address[0]  # First consider address to be one field
         # But then try to split address into two fields and overwrite the field
         # if necessary.
-        delimiters = ['Suite', 'Ste', 'Unit', 'Apartment', 'Apt', 'Department',
-                      'Dpt']
-        for delimiter in delimiters:
+        for delimiter in ADDRESS2_DELIMITERS:
             split_address = address[0].split(delimiter)
             if len(split_address) > 1:
                 record['address1'] = split_address[0].rstrip()
                 record['address2'] = delimiter + split_address[1]
-        # Fix SSN key to match Profile fields
-        ssn = record.pop('ssn')
-        record['national_id1'] = ssn
         # Split birthdate to match Profile fields
         birthdate = record.pop('birthdate')
         birthdate = birthdate.split('-')
         record['birth_year'] = birthdate[0]
         record['birth_month'] = birthdate[1]
         record['birth_day'] = birthdate[2]
-        # Fix 0+/- blood type to be O+/-
-        blood = record.pop('blood_group')
-        record['blood_type'] = blood.replace('0', 'O')
-    return tuple(sorted(population, key=lambda profile: profile['forename']))
+        record['blood_type'] = blood_types[i]
+    return tuple(sorted(population, key=itemgetter('forename')))
 
 
 if __name__ == '__main__':
@@ -119,8 +146,8 @@ if __name__ == '__main__':
         records = create_population(int(args.N), args.start_date, args.end_date)
         # Write records
         filepath = os.path.join(this_dir, args.f)
-        with open(filepath, 'w+') as data_file:
-            json.dump(records, data_file)
+        with open(filepath, 'w', 1 << 20) as data_file:
+            json.dump(records, data_file, separators=(',', ':'))
         # Confirm success
         print("Data written to {}".format(filepath))
 
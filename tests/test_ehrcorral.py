@@ -12,16 +12,16 @@ from __future__ import unicode_literals
 import os
 
 import numpy as np
-import unittest2 as unittest
-from faker import Faker
+import unittest
 
 from ehrcorral.compressions import soundex, nysiis, metaphone, dmetaphone
+from ehrcorral.compressions import first_letter
 from ehrcorral.ehrcorral import Herd
 from ehrcorral.ehrcorral import compress
 from ehrcorral.ehrcorral import gen_record
 from ehrcorral.measures import *
-
-fake = Faker()
+from ehrcorral.metaphone import encode_batch
+from ehrcorral.word import Word
 
 
 try:
@@ -31,16 +31,20 @@ except NameError:
     unicode = str
     basestring = (str, bytes)
 
+# Profiles shared by every test that needs a realistic population; they are
+# only read, so loading them once at import is enough
+DATA_PATH = os.path.join(os.path.dirname(__file__), 'profiles_100.json')
+with open(DATA_PATH, 'r') as data_file:
+    POPULATION = tuple(json.load(data_file))
+
 
 class TestHerdProperties(unittest.TestCase):
 
-    def setUp(self):
-        data_path = os.path.join(os.path.dirname(__file__), 'profiles_100.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        self.herd = Herd()
-        self.herd.populate(records)
+    @classmethod
+    def setUpClass(cls):
+        records = [gen_record(profile) for profile in POPULATION]
+        cls.herd = Herd()
+        cls.herd.populate(records)
 
     def test_herd_str_method(self):
         try:
@@ -59,6 +63,17 @@ class TestHerdProperties(unittest.TestCase):
     def test_retrieving_populated_herd_size(self):
         self.assertEqual(self.herd.size, 100)
 
+
+class TestEmptyHerd(unittest.TestCase):
+
+    def test_populating_herd_catches_invalid_populations(self):
+        herd = Herd()
+        for population in ('test', None, {'test': 'test'}):
+            with self.subTest(population=population):
+                with self.assertRaises(ValueError):
+                    herd.populate(population)
+        self.assertEqual(herd.size, 0)
+
     def test_retrieving_herd_size_with_no_population(self):
         try:
             herd = Herd()
@@ -69,10 +84,9 @@ class TestHerdProperties(unittest.TestCase):
 
 class TestHerdCreation(unittest.TestCase):
 
-    def setUp(self):
-        data_path = os.path.join(os.path.dirname(__file__), 'profiles_100.json')
-        with open(data_path, 'r') as data_file:
-            self.profiles = tuple(json.load(data_file))
+    @classmethod
+    def setUpClass(cls):
+        cls.profiles = POPULATION
 
     def test_population_loaded_correctly(self):
         self.assertEqual(len(self.profiles), 100)
@@ -86,16 +100,14 @@ class TestHerdCreation(unittest.TestCase):
 
 class TestHerdCorral(unittest.TestCase):
 
-    def setUp(self):
-        data_path = os.path.join(os.path.dirname(__file__), 'profiles_100.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        self.herd = Herd()
-        self.herd.populate(records)
+    @classmethod
+    def setUpClass(cls):
+        records = [gen_record(profile) for profile in POPULATION]
+        cls.herd = Herd()
+        cls.herd.populate(records)
+        cls.herd.corral()
 
     def test_herd_corraling(self):
-        self.herd.corral()
         for record in self.herd._population:
             self.assertIsInstance(record._blocks, tuple)
             self.assertTrue(1 <= len(record._blocks) <= 8)
@@ -115,7 +127,8 @@ class TestHerdCorral(unittest.TestCase):
 
 class TestHerdFrequencyDictionaries(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         population = (
             {
                 'forename': 'Adelyn',
@@ -139,42 +152,63 @@ class TestHerdFrequencyDictionaries(unittest.TestCase):
                 'birth_surname': 'Gerlach'
             }
         )
+        cls.population = population
         records = [gen_record(profile) for profile in population]
-        self.herd = Herd()
-        self.herd.populate(records)
-        self.herd.corral()
+        cls.herd = Herd()
+        cls.herd.populate(records)
+        cls.herd.corral()
 
     def test_forename_freq_dict(self):
         self.assertEqual(self.herd._forename_freq_dict['J'], 3)
         self.assertEqual(self.herd._forename_freq_dict['H'], 2)
         self.assertEqual(self.herd._forename_freq_dict['j'], 0)
         self.assertEqual(len(self.herd._forename_freq_dict.keys()), 4)
+        self.assertEqual(self.herd._forename_freq_total, 7)
 
     def test_surname_freq_dict(self):
         self.assertEqual(self.herd._surname_freq_dict['SM0'], 2)
         self.assertEqual(self.herd._surname_freq_dict['KRLK'], 2)
         self.assertEqual(self.herd._surname_freq_dict['smo'], 0)
         self.assertEqual(len(self.herd._surname_freq_dict.keys()), 4)
+        self.assertEqual(self.herd._surname_freq_total, 6)
+
+    def test_append_names_freq_counters(self):
+        herd = Herd()
+        herd.populate([gen_record(profile) for profile in self.population])
+        for i, record in enumerate(herd._population):
+            record.save_name_freq_refs(i, first_letter, dmetaphone)
+            herd.append_names_freq_counters(record)
+        self.assertEqual(herd._forename_freq_dict,
+                         self.herd._forename_freq_dict)
+        self.assertEqual(herd._surname_freq_dict,
+                         self.herd._surname_freq_dict)
+        self.assertEqual(herd._forename_freq_total, 7)
+        self.assertEqual(herd._surname_freq_total, 6)
 
 
 class TestRecordGeneration(unittest.TestCase):
 
-    def setUp(self):
-        data_path = os.path.join(os.path.dirname(__file__), 'profiles_100.json')
-        with open(data_path, 'r') as data_file:
-            self.profiles = tuple(json.load(data_file))
+    @classmethod
+    def setUpClass(cls):
+        cls.profiles = POPULATION
 
     def test_record_generation_from_fake_profiles(self):
         records = [gen_record(profile) for profile in self.profiles]
         self.assertEqual(len(records), 100)
 
+
+class TestRecordValidation(unittest.TestCase):
+
     def test_record_generation_catches_invalid_profiles(self):
-        with self.assertRaises(ValueError):
-            record = gen_record({'forename': 'Joe'})
-        with self.assertRaises(ValueError):
-            record = gen_record({'birth_surname': 'Smith'})
-        with self.assertRaises(ValueError):
-            record = gen_record({'test': 'test'})
+        invalid_profiles = (
+            {'forename': 'Joe'},
+            {'birth_surname': 'Smith'},
+            {'test': 'test'},
+        )
+        for profile in invalid_profiles:
+            with self.subTest(profile=profile):
+                with self.assertRaises(ValueError):
+                    gen_record(profile)
 
 
 class TestPhonemicCompression(unittest.TestCase):
@@ -216,6 +250,23 @@ class TestPhonemicCompression(unittest.TestCase):
         empty_compression = compress(self.empty, dmetaphone)
         self.assertEqual(empty_compression, [''])
 
+    def test_dmetaphone_batch(self):
+        names = self.names + self.empty + self.name
+        batch = encode_batch(names)
+        self.assertEqual(batch, [dmetaphone(name) for name in names])
+        self.assertEqual(batch[0], ('JLFX', 'ALFX'))
+        self.assertEqual(encode_batch([]), [])
+
+
+class TestWord(unittest.TestCase):
+
+    def test_get_letters(self):
+        word = Word('Smith')
+        self.assertEqual(word.get_letters(0), 'S')
+        self.assertEqual(word.get_letters(1), 'M')
+        self.assertEqual(word.get_letters(0, 0), '')
+        self.assertEqual(word.get_letters(1, 3), 'MI')
+
 
 class TestPhonemicBlocking(unittest.TestCase):
 
@@ -238,17 +289,18 @@ class TestPhonemicBlocking(unittest.TestCase):
     def test_multiple_surnames_and_forenames(self):
         self.female_record.gen_blocks(dmetaphone)
         expected_blocks = ['PRTLA', 'KRLKA', 'JRLKA', 'PRTLH', 'KRLKH', 'JRLKH']
-        self.assertItemsEqual(self.female_record._blocks, expected_blocks)
+        self.assertCountEqual(self.female_record._blocks, expected_blocks)
 
     def test_single_forename_and_surname(self):
         self.male_record.gen_blocks(dmetaphone)
         expected_blocks = ['NTRO']
-        self.assertItemsEqual(self.male_record._blocks, expected_blocks)
+        self.assertCountEqual(self.male_record._blocks, expected_blocks)
 
 
 class TestMeasuresSimilarityFunctions(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         population = (
             {
                 'forename': 'Adelyn',
@@ -306,9 +358,9 @@ class TestMeasuresSimilarityFunctions(unittest.TestCase):
             }
         )
         records = [gen_record(profile) for profile in population]
-        self.herd = Herd()
-        self.herd.populate(records)
-        self.herd.corral()
+        cls.herd = Herd()
+        cls.herd.populate(records)
+        cls.herd.corral()
 
     def test_extract_forename_info(self):
         record = self.herd._population[0]
@@ -435,6 +487,18 @@ class TestMeasuresSimilarityFunctions(unittest.TestCase):
         self.assertEqual(clean_address(u''), u'')
         self.assertEqual(clean_address(u' '), u'')
 
+    def test_clean_address_stored_on_record(self):
+        record = gen_record({'forename': 'John',
+                             'current_surname': 'Doe',
+                             'address1': '448 Jones Avenue',
+                             'address2': 'Apartment 2'})
+        self.assertEqual(record._clean_address, u'448 jones ave apt 2')
+        self.assertEqual(get_clean_address(record), u'448 jones ave apt 2')
+        record.profile = gen_record({'forename': 'John',
+                                     'current_surname': 'Doe',
+                                     'address1': '12 Main Street'}).profile
+        self.assertEqual(get_clean_address(record), u'12 main st')
+
     def test_post_code_similarity(self):
         records = [self.herd._population[0], self.herd._population[1]]
         weight = get_post_code_similarity(records, damerau_levenshtein)
@@ -488,6 +552,16 @@ class TestMeasuresSimilarityFunctions(unittest.TestCase):
         weight = get_id_similarity(records, damerau_levenshtein)
         self.assertEqual(weight, 7)
 
+    def test_damerau_levenshtein(self):
+        self.assertEqual(damerau_levenshtein('95786', '95786'), 0)
+        self.assertEqual(damerau_levenshtein('95786', '97586'), 1)
+        self.assertEqual(damerau_levenshtein('d599776', 'd599886'), 2)
+        self.assertEqual(damerau_levenshtein('d599776', ''), 7)
+        self.assertEqual(damerau_levenshtein('', 'd599776'), 7)
+        self.assertEqual(damerau_levenshtein('kitten', 'sitting'), 3)
+        self.assertEqual(damerau_levenshtein('kitten', 'kittne'), 1)
+        self.assertEqual(damerau_levenshtein('ca', 'abc'), 3)
+
     def test_record_similarity(self):
         records = [self.herd._population[0], self.herd._population[1]]
         weight = record_similarity(self.herd,
@@ -528,7 +602,8 @@ class TestMeasuresSimilarityFunctions(unittest.TestCase):
 
 class TestHerdSimilarityMatrix(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         population = (
             {
                 'forename': 'Adelyn',
@@ -564,9 +639,9 @@ class TestHerdSimilarityMatrix(unittest.TestCase):
             }
         )
         records = [gen_record(profile) for profile in population]
-        self.herd = Herd()
-        self.herd.populate(records)
-        self.herd.corral()
+        cls.herd = Herd()
+        cls.herd.populate(records)
+        cls.herd.corral()
 
     def test_similarity_matrix(self):
         test_similarity = np.array([
@@ -603,101 +678,28 @@ class TestHerdSimilarityMatrix(unittest.TestCase):
 
 class TestCommonCharacterErrors(unittest.TestCase):
 
-    def setUp(self):
-        pass
-
-    def tearDown(self):
-        pass
-
-    def test_no_errors(self):
-        """See how the probability matrix looks with no textual errors."""
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'error_free_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
-
-    def test_character_insertion(self):
-        """See how character insertion in someone's name impacts probability
-        matrix.
-        """
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'character_insertion_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
-
-    def test_character_omission(self):
-        """See how character omission in someone's name impacts probability
+    # Each file holds two records for each of three people, differing by one
+    # kind of textual error
+    ERROR_FILES = (
+        ('no_errors', 'error_free_3x2.json'),
+        ('character_insertion', 'character_insertion_3x2.json'),
+        ('character_omission', 'character_omission_3x2.json'),
+        ('character_substitution', 'character_substitution_3x2.json'),
+        ('character_transposition', 'character_transposition_3x2.json'),
+        ('gender_misclassification', 'gender_misclassification_3x2.json'),
+    )
+
+    def test_common_character_errors(self):
+        """See how each kind of textual error impacts the probability
         matrix.
         """
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'character_omission_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
-
-    def test_character_substitution(self):
-        """See how character substitution in someone's name impacts probability
-        matrix.
-        """
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'character_substitution_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
-
-    def test_character_transposition(self):
-        """See how character transposition in someone's name impacts probability
-        matrix.
-        """
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'character_transposition_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
-
-    def test_gender_misclassification(self):
-        """See how gender misclassification impacts probability matrix.
-        """
-        herd = Herd()
-        data_path = os.path.join(os.path.dirname(__file__),
-                                 'gender_misclassification_3x2.json')
-        with open(data_path, 'r') as data_file:
-            population = tuple(json.load(data_file))
-        records = [gen_record(profile) for profile in population]
-        herd = Herd()
-        herd.populate(records)
-        herd.corral()
-        print()
-        print(herd.similarity_matrix)
+        for error, filename in self.ERROR_FILES:
+            with self.subTest(error=error):
+                data_path = os.path.join(os.path.dirname(__file__), filename)
+                with open(data_path, 'r') as data_file:
+                    population = json.load(data_file)
+                records = [gen_record(profile) for profile in population]
+                herd = Herd()
+                herd.populate(records)
+                herd.corral()
+                self.assertEqual(herd.similarity_matrix.shape, (6, 6))